@@ -2,8 +2,10 @@
 
 import logging
 from pathlib import Path
+from sqlite3 import Connection as SQLite3Connection
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import ConnectionPoolEntry, QueuePool
 
 from supramol_explorer.utils.settings import (
     SETTINGS,
@@ -21,7 +23,44 @@ logging.basicConfig(
     datefmt="%d-%b-%y %H:%M:%S",
 )
 
+# WAL avoids the rollback-journal fsync pair on every commit and lets
+# readers run alongside a writer; NORMAL sync is safe in WAL mode.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def set_sqlite_pragmas(
+    dbapi_connection: SQLite3Connection,
+    connection_record: ConnectionPoolEntry,
+) -> None:
+    """Apply the write-friendly SQLite PRAGMAs on every new connection."""
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
 if __name__ == "__main__":
-    logger.info(f"Starting code in {__name__}.")
-    logger.info(f"Loaded settings from {SETTINGS_PATH.name}.")
-    engine = create_engine(f"sqlite:////{SETTINGS["paths"]["database"]}")
+    logger.info("Starting code in %s.", __name__)
+    logger.info("Loaded settings from %s.", SETTINGS_PATH.name)
+    db_path = Path(SETTINGS["paths"]["database"]).as_posix()
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        poolclass=QueuePool,
+        pool_size=SETTINGS["database"]["pool_size"],
+        max_overflow=SETTINGS["database"]["max_overflow"],
+        pool_pre_ping=SETTINGS["database"]["pool_pre_ping"],
+        query_cache_size=1200,
+        connect_args={
+            "check_same_thread": False,
+            "timeout": 30,
+            "cached_statements": 1000,
+        },
+    )
+    if SETTINGS["database"]["pragmas"]:
+        event.listen(engine, "connect", set_sqlite_pragmas)
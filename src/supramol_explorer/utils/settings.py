@@ -3,13 +3,25 @@
 import tomllib
 from pathlib import Path
 
+# Engine defaults, overridable from the [database] table. SQLite allows a
+# single writer, so a handful of pooled connections (WAL readers) is enough;
+# a local file handle never goes stale, so pre-ping only costs a round trip.
+DATABASE_DEFAULTS = {
+    "pragmas": True,
+    "pool_size": 5,
+    "max_overflow": 0,
+    "pool_pre_ping": False,
+}
+
 # Load all settings.
 SETTINGS_PATH = Path(".env.toml")
 
-if not SETTINGS_PATH.exists():
+if not SETTINGS_PATH.is_file():
     SETTINGS_PATH = Path("settings.toml")
-    if not SETTINGS_PATH.exists():
+    if not SETTINGS_PATH.is_file():
         raise RuntimeError("Settings must be in .env.toml or settings.toml!")
 
-with open(SETTINGS_PATH, "rb") as f:
+with SETTINGS_PATH.open("rb") as f:
     SETTINGS = tomllib.load(f)
+
+SETTINGS["database"] = DATABASE_DEFAULTS | SETTINGS.get("database", {})